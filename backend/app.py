@@ -1,6 +1,8 @@
 import os
 import math
 import json
+import time
+import hashlib
 import logging
 from flask import Flask, request, jsonify
 from flask_cors import CORS
@@ -13,7 +15,7 @@ load_dotenv()
 
 app = Flask(__name__)
 # Allow CORS for all domains for now (or restrict to Vercel app in production)
-CORS(app)
+CORS(app, expose_headers=['X-Catalog-Version'])
 
 # Configure Logging
 logging.basicConfig(level=logging.INFO)
@@ -46,8 +48,37 @@ TRAIT_NAMES = [
     "compassion", "introversion"
 ]
 
+# Catalog version cache (see get_catalog_version)
+CATALOG_VERSION_TTL = 60
+CATALOG_VERSION_CACHE = {'version': None, 'expires': 0}
+
 # --- Helper Functions ---
 
+def get_catalog_version(characters=None):
+    """Return a short content hash of the character catalog.
+
+    Clients cache the catalog under this version and resolve compact
+    score responses (character ids only) against it. The hash covers
+    every character field, so reseeds and in-place edits both change
+    it. It is cached for CATALOG_VERSION_TTL seconds to keep the Mongo
+    read off the request path; callers that already hold the full
+    catalog pass it in to refresh the cache without another read.
+    Returns None for an empty catalog, which is never cached.
+    """
+    now = time.time()
+    if characters is None:
+        if CATALOG_VERSION_CACHE['version'] and now < CATALOG_VERSION_CACHE['expires']:
+            return CATALOG_VERSION_CACHE['version']
+        characters = list(db.characters.find({}, {'_id': 0}))
+    if not characters:
+        return None
+    ordered = sorted(characters, key=lambda c: c.get('name', ''))
+    payload = json.dumps(ordered, sort_keys=True, default=str)
+    version = hashlib.sha1(payload.encode('utf-8')).hexdigest()[:12]
+    CATALOG_VERSION_CACHE['version'] = version
+    CATALOG_VERSION_CACHE['expires'] = now + CATALOG_VERSION_TTL
+    return version
+
 def cosine_similarity(vec1, vec2):
     """Calculate cosine similarity between two vectors"""
     if len(vec1) != len(vec2):
@@ -239,14 +270,26 @@ def get_questions():
 
 @app.route('/api/characters', methods=['GET'])
 def get_characters():
-    """Get characters (optionally filtered by universes)"""
+    """Get characters (optionally filtered by universes or names).
+
+    Unfiltered responses carry the catalog version in X-Catalog-Version;
+    filtered subsets do not, since they cannot serve as a full catalog.
+    """
     universes = request.args.getlist('universe')
+    names = request.args.getlist('name')
     query = {}
     if universes:
         query['universe'] = {'$in': universes}
+    if names:
+        query['name'] = {'$in': names}
     
     characters = list(db.characters.find(query, {'_id': 0}))
-    return jsonify(characters)
+    response = jsonify(characters)
+    if not query:
+        version = get_catalog_version(characters)
+        if version:
+            response.headers['X-Catalog-Version'] = version
+    return response
 
 @app.route('/api/score', methods=['POST'])
 def calculate_score():
@@ -264,6 +307,8 @@ def calculate_score():
     favorite_actors = data.get('favorite_actors', [])
     favorite_cricketer = data.get('favorite_cricketer', '')
     favorite_personality = data.get('favorite_personality', '')
+    # Compact mode: return character ids instead of full documents
+    compact = data.get('compact') is True
     
     # 2. Build Vectors
     question_vector = build_question_vector(answers)
@@ -357,6 +402,27 @@ def calculate_score():
             
     db.quiz_results.insert_one(result_doc)
     
+    if compact:
+        # Character names double as ids; clients resolve them against
+        # the catalog cached from /api/characters. An unfiltered query
+        # already holds the full catalog, so hash it directly.
+        catalog_version = get_catalog_version(None if query else characters)
+        return jsonify({
+            'matches': [{
+                'character_id': m['character']['name'],
+                'score': m['score'],
+                'percentage': m['percentage']
+            } for m in top_matches],
+            'user_vector': final_user_vector,
+            'universe_breakdown': [{
+                'universe': item['universe'],
+                'character_id': item['character']['name'],
+                'score': item['score'],
+                'percentage': item['percentage']
+            } for item in universe_breakdown],
+            'catalog_version': catalog_version
+        })
+    
     return jsonify({
         'matches': top_matches, 
         'user_vector': final_user_vector,
@@ -0,0 +1,148 @@
+"""
+Tests for the /api/score response modes and catalog versioning
+"""
+
+import copy
+import unittest
+from unittest.mock import MagicMock, patch
+import app as app_module
+
+CHARACTERS = [
+    {
+        'name': 'Eleven',
+        'universe': 'Stranger Things',
+        'series': 'Stranger Things',
+        'image_url': 'https://example.com/eleven.png',
+        'bio': 'A girl with telekinetic powers.',
+        'traits': {t: 0.9 for t in app_module.TRAIT_NAMES}
+    },
+    {
+        'name': 'Tony Stark',
+        'universe': 'Marvel',
+        'series': 'Avengers',
+        'image_url': 'https://example.com/tony.png',
+        'bio': 'Genius, billionaire, philanthropist.',
+        'traits': {t: 0.2 for t in app_module.TRAIT_NAMES}
+    }
+]
+
+def make_db(characters=None):
+    """Build a mock database holding the given character catalog"""
+    catalog = CHARACTERS if characters is None else characters
+    db = MagicMock()
+    db.characters.find.side_effect = lambda *args, **kwargs: copy.deepcopy(catalog)
+    db.questions.find_one.return_value = None
+    return db
+
+def reset_version_cache():
+    """Clear the cached catalog version between tests"""
+    app_module.CATALOG_VERSION_CACHE.update({'version': None, 'expires': 0})
+
+class TestScoreResponseModes(unittest.TestCase):
+
+    def setUp(self):
+        reset_version_cache()
+        patcher = patch.object(app_module, 'db', make_db())
+        self.db = patcher.start()
+        self.addCleanup(patcher.stop)
+        self.client = app_module.app.test_client()
+
+    def post_score(self, **extra):
+        payload = {'name': 'Tester', 'answers': [], 'universes': ['Select All']}
+        payload.update(extra)
+        return self.client.post('/api/score', json=payload)
+
+    def test_compact_response_contains_ids_only(self):
+        """Compact mode returns ids, scores and percentages plus catalog version"""
+        data = self.post_score(compact=True).get_json()
+
+        self.assertEqual(data['catalog_version'], app_module.get_catalog_version())
+        self.assertEqual(self.db.quiz_results.insert_one.call_count, 1)
+        self.assertEqual(len(data['matches']), 2)
+        for match in data['matches']:
+            self.assertEqual(set(match), {'character_id', 'score', 'percentage'})
+        self.assertEqual(len(data['universe_breakdown']), 2)
+        for item in data['universe_breakdown']:
+            self.assertEqual(set(item), {'universe', 'character_id', 'score', 'percentage'})
+        self.assertEqual(
+            {m['character_id'] for m in data['matches']},
+            {c['name'] for c in CHARACTERS}
+        )
+
+    def test_full_response_unchanged(self):
+        """Without compact the full character documents are embedded"""
+        data = self.post_score().get_json()
+
+        self.assertEqual(set(data), {'matches', 'user_vector', 'universe_breakdown'})
+        for match in data['matches']:
+            self.assertEqual(set(match), {'character', 'score', 'percentage'})
+            self.assertIn(match['character'], CHARACTERS)
+        for item in data['universe_breakdown']:
+            self.assertEqual(set(item), {'universe', 'character', 'score', 'percentage'})
+
+    def test_compact_requires_boolean_true(self):
+        """String values such as "false" do not enable compact mode"""
+        data = self.post_score(compact='false').get_json()
+        self.assertNotIn('catalog_version', data)
+        self.assertIn('character', data['matches'][0])
+
+    def test_characters_sets_catalog_version_header(self):
+        """Unfiltered /api/characters reports the same catalog version"""
+        score = self.post_score(compact=True).get_json()
+        response = self.client.get('/api/characters')
+
+        self.assertEqual(response.headers.get('X-Catalog-Version'), score['catalog_version'])
+
+    def test_filtered_characters_omit_catalog_version_header(self):
+        """Filtered subsets are not a full catalog and carry no version"""
+        response = self.client.get('/api/characters?universe=Marvel')
+        self.assertNotIn('X-Catalog-Version', response.headers)
+
+    def test_characters_filter_by_name(self):
+        """Unresolved ids can be fetched by name without a version header"""
+        response = self.client.get('/api/characters?name=Eleven&name=Tony Stark')
+
+        query = self.db.characters.find.call_args[0][0]
+        self.assertEqual(query, {'name': {'$in': ['Eleven', 'Tony Stark']}})
+        self.assertNotIn('X-Catalog-Version', response.headers)
+
+class TestCatalogVersion(unittest.TestCase):
+
+    def setUp(self):
+        reset_version_cache()
+
+    def test_version_changes_after_in_place_edit(self):
+        """Editing a character's content changes the version once the cache expires"""
+        edited = copy.deepcopy(CHARACTERS)
+        edited[0]['bio'] = 'An updated bio.'
+
+        with patch.object(app_module, 'db', make_db()):
+            before = app_module.get_catalog_version()
+        reset_version_cache()
+        with patch.object(app_module, 'db', make_db(edited)):
+            after = app_module.get_catalog_version()
+        self.assertNotEqual(before, after)
+
+    def test_version_is_cached(self):
+        """Repeated lookups within the TTL do not hit the database"""
+        db = make_db()
+        with patch.object(app_module, 'db', db):
+            first = app_module.get_catalog_version()
+            second = app_module.get_catalog_version()
+        self.assertEqual(first, second)
+        self.assertEqual(db.characters.find.call_count, 1)
+
+    def test_version_independent_of_order(self):
+        """Passing the catalog in any order yields the cached version"""
+        with patch.object(app_module, 'db', make_db()):
+            expected = app_module.get_catalog_version()
+        self.assertEqual(app_module.get_catalog_version(list(reversed(CHARACTERS))), expected)
+
+    def test_empty_catalog_has_no_version(self):
+        """An empty catalog reports no version and is never cached"""
+        with patch.object(app_module, 'db', make_db([])):
+            self.assertIsNone(app_module.get_catalog_version())
+        self.assertIsNone(app_module.CATALOG_VERSION_CACHE['version'])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -48,6 +48,9 @@ export default function Quiz() {
 
     // 2. Load questions with count
     loadQuestions(count)
+
+    // 3. Warm the character catalog so submitting doesn't wait on it
+    apiService.prefetchCatalog()
     // Removed loadQuizData call as we did it inline
   }, [])
 
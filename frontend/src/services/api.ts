@@ -1,6 +1,15 @@
 /// <reference types="vite/client" />
 import axios from 'axios'
-import { Question, Character, QuizData, QuizResult, AmritanshuFeedback, MediaTraits } from '../types'
+import {
+  Question,
+  Character,
+  QuizData,
+  ScoreResult,
+  CompactScoreResult,
+  CharacterCatalog,
+  AmritanshuFeedback,
+  MediaTraits
+} from '../types'
 
 const API_BASE_URL = import.meta.env.VITE_API_URL || 'http://localhost:5000'
 
@@ -11,7 +20,122 @@ const api = axios.create({
   },
 })
 
+const CATALOG_STORAGE_KEY = 'characterCatalog'
+
+let catalogCache: CharacterCatalog | null = null
+let catalogRequest: Promise<void> | null = null
+
+const readStoredCatalog = (): CharacterCatalog | null => {
+  try {
+    const stored = localStorage.getItem(CATALOG_STORAGE_KEY)
+    return stored ? JSON.parse(stored) : null
+  } catch {
+    return null
+  }
+}
+
+const clearCatalog = () => {
+  catalogCache = null
+  try {
+    localStorage.removeItem(CATALOG_STORAGE_KEY)
+  } catch {
+    // Storage unavailable; nothing persisted to clear
+  }
+}
+
+const storeCatalog = (catalog: CharacterCatalog) => {
+  catalogCache = catalog
+  try {
+    localStorage.setItem(CATALOG_STORAGE_KEY, JSON.stringify(catalog))
+  } catch {
+    // Storage full or unavailable; keep the in-memory copy
+  }
+}
+
+const indexCharacters = (list: Character[]): Record<string, Character> => {
+  const characters: Record<string, Character> = {}
+  for (const character of list) {
+    characters[character.name] = character
+  }
+  return characters
+}
+
+// Fetches the full catalog; version is empty when the server sent no
+// X-Catalog-Version header, in which case the catalog must not be cached
+const fetchCatalog = async (): Promise<CharacterCatalog> => {
+  const response = await api.get('/api/characters')
+  return {
+    version: response.headers['x-catalog-version'] || '',
+    characters: indexCharacters(response.data)
+  }
+}
+
+// Returns the character catalog keyed by id (name), refetching only when
+// the server reports a different catalog version. A fetched catalog is
+// cached only when its X-Catalog-Version header matches the requested
+// version; otherwise it is used for this request alone.
+const getCatalog = async (version: string | null): Promise<CharacterCatalog> => {
+  if (catalogRequest) await catalogRequest
+  if (!catalogCache) catalogCache = readStoredCatalog()
+  if (version && catalogCache && catalogCache.version === version) return catalogCache
+
+  const catalog = await fetchCatalog()
+  if (catalog.version && catalog.version === version) storeCatalog(catalog)
+  return catalog
+}
+
+// Fetches only the given characters, for ids a fresh catalog still lacks
+const fetchCharacters = async (ids: string[]): Promise<Record<string, Character>> => {
+  const params = new URLSearchParams()
+  ids.forEach(id => params.append('name', id))
+  const response = await api.get(`/api/characters?${params.toString()}`)
+  return indexCharacters(response.data)
+}
+
+const unresolvedIds = (result: CompactScoreResult, catalog: CharacterCatalog): string[] =>
+  [...result.matches, ...result.universe_breakdown]
+    .map(m => m.character_id)
+    .filter(id => !catalog.characters[id])
+
+// Resolves character ids against the catalog; returns null if any id is
+// missing, which means the catalog is out of date
+const hydrateScore = (result: CompactScoreResult, catalog: CharacterCatalog): ScoreResult | null => {
+  if (unresolvedIds(result, catalog).length > 0) return null
+
+  const resolve = (id: string) => catalog.characters[id]
+  return {
+    matches: result.matches.map(m => ({
+      character: resolve(m.character_id),
+      score: m.score,
+      percentage: m.percentage
+    })),
+    user_vector: result.user_vector,
+    universe_breakdown: result.universe_breakdown.map(m => ({
+      universe: m.universe,
+      character: resolve(m.character_id),
+      score: m.score,
+      percentage: m.percentage
+    }))
+  }
+}
+
 export const apiService = {
+  // Warm the character catalog cache in the background so compact score
+  // responses can be resolved without a catalog download on submit
+  prefetchCatalog: (): void => {
+    if (catalogRequest || catalogCache || readStoredCatalog()) return
+    catalogRequest = fetchCatalog()
+      .then(catalog => {
+        if (catalog.version) storeCatalog(catalog)
+      })
+      .catch(() => {
+        // Best effort; submitQuiz fetches the catalog if still missing
+      })
+      .finally(() => {
+        catalogRequest = null
+      })
+  },
+
   // Questions
   getQuestions: async (limit: number = 20): Promise<Question[]> => {
     const response = await api.get(`/api/questions?count=${limit}`)
@@ -29,9 +153,29 @@ export const apiService = {
   },
 
   // Quiz scoring
-  submitQuiz: async (data: QuizData): Promise<QuizResult> => {
-    const response = await api.post('/api/score', data)
-    return response.data
+  submitQuiz: async (data: QuizData): Promise<ScoreResult> => {
+    const response = await api.post('/api/score', { ...data, compact: true })
+    const result: CompactScoreResult = response.data
+
+    let catalog = await getCatalog(result.catalog_version)
+    const hydrated = hydrateScore(result, catalog)
+    if (hydrated) return hydrated
+
+    // Stale catalog: drop it and refetch once
+    clearCatalog()
+    catalog = await getCatalog(result.catalog_version)
+    const retried = hydrateScore(result, catalog)
+    if (retried) return retried
+
+    // Still unresolved: fetch just those characters rather than rescoring,
+    // which would record the attempt twice
+    const missing = await fetchCharacters(unresolvedIds(result, catalog))
+    const patched = hydrateScore(result, {
+      version: catalog.version,
+      characters: { ...catalog.characters, ...missing }
+    })
+    if (patched) return patched
+    throw new Error('Could not resolve matched characters')
   },
 
   // Amritanshu feedback
@@ -61,6 +61,45 @@ export interface QuizResult {
   finalVector: number[]
 }
 
+export interface ScoreMatch {
+  character: Character
+  score: number
+  percentage: number
+}
+
+export interface UniverseMatch extends ScoreMatch {
+  universe: string
+}
+
+export interface ScoreResult {
+  matches: ScoreMatch[]
+  user_vector: number[]
+  universe_breakdown: UniverseMatch[]
+}
+
+// Compact /api/score response: characters are referenced by id (name)
+export interface CompactMatch {
+  character_id: string
+  score: number
+  percentage: number
+}
+
+export interface CompactUniverseMatch extends CompactMatch {
+  universe: string
+}
+
+export interface CompactScoreResult {
+  matches: CompactMatch[]
+  user_vector: number[]
+  universe_breakdown: CompactUniverseMatch[]
+  catalog_version: string | null
+}
+
+export interface CharacterCatalog {
+  version: string
+  characters: Record<string, Character>
+}
+
 export interface AmritanshuFeedback {
   name: string
   selected_trait: string